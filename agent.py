@@ -1,17 +1,72 @@
 """Kedro Management Agent using LangGraph ReAct framework."""
 
+import asyncio
+import atexit
+import contextlib
+import functools
+import hashlib
+import io
+import logging
+import multiprocessing
 import os
 import subprocess
+from collections.abc import AsyncIterator
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import Any
 
+import click
 import structlog
+from kedro.framework.cli.starters import TOOLS_SHORTNAME_TO_NUMBER, create_cli
 from kedro.framework.session import KedroSession
-from langchain.tools import StructuredTool, Tool
+from kedro.framework.startup import ProjectMetadata, bootstrap_project
+from langchain.tools import BaseTool, StructuredTool, Tool
+from langchain_core.messages import SystemMessage
 from langchain_ollama import ChatOllama
+from langgraph.checkpoint.base import BaseCheckpointSaver
+from langgraph.checkpoint.memory import InMemorySaver
+from langgraph.graph.state import CompiledStateGraph
 from langgraph.prebuilt import create_react_agent
-from pydantic import BaseModel, Field
+from langgraph.types import StateSnapshot
+from pydantic import BaseModel, Field, field_validator
 
 logger = structlog.get_logger(__name__)
 
+_KEDRO_NEW_PREFIX = ("kedro", "new")
+# Values accepted by ``kedro new --tools``, checked up front so invalid input
+# fails schema validation instead of a ``kedro new`` run. Tool names, aliases
+# included, come from Kedro itself so that they can't drift from it.
+_KEDRO_TOOLS = frozenset(TOOLS_SHORTNAME_TO_NUMBER)
+_KEDRO_TOOLS_SHORTCUTS = frozenset({"all", "none"})
+# Resolved once, so projects are created and pipelines run relative to where the
+# agent started. Pool workers are handed the agent's value when they start.
+_CWD = os.getcwd()
+
+# Ollama only serves a handful of requests in parallel (``OLLAMA_NUM_PARALLEL``),
+# so batches are throttled to stay within that budget instead of queueing. The
+# pipeline worker pool is capped at the same size rather than one per CPU.
+DEFAULT_MAX_CONCURRENCY = 5
+
+
+def configure_logging(level: str = "INFO") -> None:
+    """
+    Drop log calls below ``level`` before they reach structlog's processors.
+
+    Filtered calls return immediately without rendering or formatting their
+    key-value pairs, so debug logging on the tool hot path costs nothing when
+    running at ``INFO`` or, in production, ``WARNING``.
+
+    Args:
+        level: Minimum log level name, e.g. 'DEBUG', 'INFO' or 'WARNING'
+    """
+    structlog.configure(
+        wrapper_class=structlog.make_filtering_bound_logger(
+            logging.getLevelNamesMapping()[level.upper()]
+        ),
+        cache_logger_on_first_use=True,
+    )
+
 
 class CreateKedroProjectArgs(BaseModel):
     """Arguments for creating a Kedro project."""
@@ -31,14 +86,80 @@ class CreateKedroProjectArgs(BaseModel):
     )
     telemetry: str = Field(default="n", description="Enable telemetry: 'y' or 'n'")
 
+    @field_validator("tools")
+    @classmethod
+    def _check_tools(cls, value: str) -> str:
+        """Reject tool selections that ``kedro new`` would refuse."""
+        value = value.strip().lower()
+        if value in _KEDRO_TOOLS_SHORTCUTS:
+            return value
+        selected = [tool.strip() for tool in value.split(",")]
+        if not _KEDRO_TOOLS.issuperset(selected):
+            allowed = ", ".join(sorted(_KEDRO_TOOLS))
+            raise ValueError(f"tools must be 'all', 'none' or any of: {allowed}")
+        return ",".join(selected)
 
-def run_kedro_pipeline(pipeline_name: str = "default") -> str:
-    """Run a Kedro pipeline by name."""
-    logger.info("Tool called: run_kedro_pipeline", pipeline_name=pipeline_name)
+
+class RunPipelinesBatchArgs(BaseModel):
+    """Arguments for running several Kedro pipelines at once."""
+
+    pipeline_names: list[str] = Field(
+        description="Names of all the Kedro pipelines the user asked to run"
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _bootstrap_kedro() -> ProjectMetadata:
+    """Locate and configure the Kedro project in the working directory once."""
+    logger.info("Bootstrapping Kedro project", project_path=_CWD)
+    return bootstrap_project(Path(_CWD))
+
+
+def _init_worker(cwd: str) -> None:
+    """Pin a worker to the directory the agent was started from."""
+    global _CWD  # noqa: PLW0603
+    _CWD = cwd
+    # ``kedro new`` creates projects in the current directory
+    os.chdir(cwd)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_executor() -> ProcessPoolExecutor:
+    """
+    Get the worker pool used to run pipelines and ``kedro new`` outside the agent.
+
+    A ``KedroSession`` only supports a single run, so sessions can't be reused
+    across tool calls. Workers are long-lived instead and bootstrap the project
+    on their first run, so later runs only pay for creating their session.
+    Bootstrapping isn't done in a pool initializer: it fails outside a Kedro
+    project, and a failing initializer breaks the whole pool.
+
+    Workers are started from a fork server rather than forked from the agent,
+    which already runs event loop and tool threads by then, and they import
+    this module afresh, hence the initializer passing on the agent's directory.
+    """
+    executor = ProcessPoolExecutor(
+        max_workers=DEFAULT_MAX_CONCURRENCY,
+        mp_context=multiprocessing.get_context("forkserver"),
+        initializer=_init_worker,
+        initargs=(_CWD,),
+    )
+    atexit.register(executor.shutdown)
+    return executor
+
+
+def _discard_executor(executor: ProcessPoolExecutor) -> None:
+    """Drop a broken worker pool, so that the next run starts a fresh one."""
+    logger.warning("Worker pool is broken, discarding it")
+    _get_executor.cache_clear()
+    executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _run_one(pipeline_name: str) -> str:
+    """Run a Kedro pipeline by name, reporting any failure as the result."""
     try:
-        logger.info("Starting Kedro session", pipeline_name=pipeline_name)
-        with KedroSession.create() as session:
-            logger.info("Running pipeline", pipeline_name=pipeline_name)
+        metadata = _bootstrap_kedro()
+        with KedroSession.create(project_path=metadata.project_path) as session:
             session.run(pipeline_name=pipeline_name)
         result = f"Pipeline '{pipeline_name}' executed successfully."
         logger.info(
@@ -53,6 +174,163 @@ def run_kedro_pipeline(pipeline_name: str = "default") -> str:
         return error_msg
 
 
+def _pool_error(executor: ProcessPoolExecutor, pipeline_name: str, e: Exception) -> str:
+    """Report a pipeline that the worker pool failed to run."""
+    if isinstance(e, BrokenProcessPool):
+        _discard_executor(executor)
+    error_msg = f"Error running pipeline: {str(e)}"
+    logger.error("Pipeline execution failed", pipeline_name=pipeline_name, error=str(e))
+    return error_msg
+
+
+def _run_one_in_pool(pipeline_name: str) -> str:
+    """
+    Run a Kedro pipeline by name in a worker process, waiting for it.
+
+    Kedro keeps the requested pipelines in process-global state, so runs from
+    concurrent threads, e.g. under ``graph.batch``, must not share a process.
+    """
+    executor = _get_executor()
+    try:
+        return executor.submit(_run_one, pipeline_name).result()
+    except Exception as e:
+        return _pool_error(executor, pipeline_name, e)
+
+
+async def _arun_one(pipeline_name: str) -> str:
+    """Run a Kedro pipeline by name in a worker process."""
+    executor = _get_executor()
+    try:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, _run_one, pipeline_name)
+    except Exception as e:
+        return _pool_error(executor, pipeline_name, e)
+
+
+def run_kedro_pipeline(pipeline_name: str = "default") -> str:
+    """Run a Kedro pipeline by name in a worker process."""
+    logger.debug("Tool called: run_kedro_pipeline", pipeline_name=pipeline_name)
+    return _run_one_in_pool(pipeline_name)
+
+
+async def arun_kedro_pipeline(pipeline_name: str = "default") -> str:
+    """Run a Kedro pipeline by name in a worker process."""
+    logger.debug("Tool called: arun_kedro_pipeline", pipeline_name=pipeline_name)
+    return await _arun_one(pipeline_name)
+
+
+def run_pipelines_batch(pipeline_names: list[str]) -> list[str]:
+    """Run several Kedro pipelines concurrently in the worker pool."""
+    logger.debug("Tool called: run_pipelines_batch", pipeline_names=pipeline_names)
+    executor = _get_executor()
+    try:
+        return list(executor.map(_run_one, pipeline_names))
+    except Exception as e:
+        if isinstance(e, BrokenProcessPool):
+            _discard_executor(executor)
+        error_msg = f"Error running pipelines: {str(e)}"
+        logger.error(
+            "Pipeline batch execution failed",
+            pipeline_names=pipeline_names,
+            error=str(e),
+        )
+        return [error_msg] * len(pipeline_names)
+
+
+async def arun_pipelines_batch(pipeline_names: list[str]) -> list[str]:
+    """Run several Kedro pipelines concurrently without blocking the event loop."""
+    logger.debug("Tool called: arun_pipelines_batch", pipeline_names=pipeline_names)
+    return list(await asyncio.gather(*(_arun_one(name) for name in pipeline_names)))
+
+
+def _kedro_new_command(
+    project_name: str, tools: str, example: str, telemetry: str
+) -> tuple[str, ...]:
+    """Build the ``kedro new`` command line for the given project options."""
+    return _KEDRO_NEW_PREFIX + (
+        "--name",
+        project_name,
+        "--tools",
+        tools,
+        "--example",
+        example,
+        "--telemetry",
+        telemetry,
+    )
+
+
+def _project_creation_result(
+    project_name: str, returncode: int, stdout: str, stderr: str
+) -> str:
+    """Turn the outcome of ``kedro new`` into the message returned to the agent."""
+    if returncode == 0:
+        success_msg = f"Kedro project '{project_name}' created successfully!"
+        if stdout:
+            success_msg += f"\n\nOutput:\n{stdout}"
+        logger.info(
+            "Project creation completed",
+            project_name=project_name,
+            result=success_msg,
+        )
+        return success_msg
+    else:
+        error_msg = f"Error creating Kedro project: {stderr or stdout}"
+        logger.error(
+            "Project creation failed", project_name=project_name, error=error_msg
+        )
+        return error_msg
+
+
+def _kedro_new_in_process(project_name: str, cmd: tuple[str, ...]) -> str | None:
+    """
+    Run ``kedro new`` inside this interpreter instead of spawning the CLI.
+
+    Only meant for pool workers, which run one task at a time: cookiecutter
+    changes the working directory while rendering a project, and Kedro's output
+    is captured by swapping ``sys.stdout``/``sys.stderr``, both process-wide.
+
+    Returns the message for the agent, including the errors Kedro reports on
+    invalid input, since the ``kedro`` executable would only fail the same way.
+    Returns ``None`` if Kedro can't be run in process at all, e.g. after an API
+    change, so that the caller can fall back to the executable.
+    """
+    stdout, stderr = io.StringIO(), io.StringIO()
+    try:
+        with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+            try:
+                exit_code = create_cli.main(
+                    args=cmd[1:], prog_name=cmd[0], standalone_mode=False
+                )
+            except SystemExit as e:
+                # Kedro exits on some invalid input, after printing the reason
+                exit_code = 1 if e.code else 0
+    except click.ClickException as e:
+        exit_code = e.exit_code
+        stderr.write(e.format_message())
+    except Exception as e:
+        logger.warning(
+            "In-process kedro new failed, falling back to subprocess", error=str(e)
+        )
+        return None
+    return _project_creation_result(
+        project_name, exit_code or 0, stdout.getvalue(), stderr.getvalue()
+    )
+
+
+def _kedro_new_in_pool(project_name: str, cmd: tuple[str, ...]) -> str | None:
+    """Run ``kedro new`` in a worker process, or return ``None`` if it can't."""
+    executor = _get_executor()
+    try:
+        return executor.submit(_kedro_new_in_process, project_name, cmd).result()
+    except Exception as e:
+        if isinstance(e, BrokenProcessPool):
+            _discard_executor(executor)
+        logger.warning(
+            "In-process kedro new failed, falling back to subprocess", error=str(e)
+        )
+        return None
+
+
 def create_kedro_project(
     project_name: str, tools: str = "none", example: str = "n", telemetry: str = "n"
 ) -> str:
@@ -66,54 +344,77 @@ def create_kedro_project(
         example: Whether to include example pipeline ('y' or 'n')
         telemetry: Whether to enable telemetry ('y' or 'n')
     """
-    logger.info(
-        "Tool called: create_kedro_project",
-        project_name=project_name,
-        tools=tools,
-        example=example,
-        telemetry=telemetry,
-    )
-
     try:
-        # Build the kedro new command
-        cmd = [
-            "kedro",
-            "new",
-            "--name",
-            project_name,
-            "--tools",
-            tools,
-            "--example",
-            example,
-            "--telemetry",
-            telemetry,
-        ]
-
-        logger.info("Executing kedro new command", command=" ".join(cmd))
+        cmd = _kedro_new_command(project_name, tools, example, telemetry)
+        logger.debug("Tool called: create_kedro_project", command=cmd)
+        message = _kedro_new_in_pool(project_name, cmd)
+        if message is not None:
+            return message
 
         # Run the command
         result = subprocess.run(
-            cmd, capture_output=True, text=True, cwd=os.getcwd(), check=False
+            cmd, capture_output=True, text=True, cwd=_CWD, check=False
+        )
+        return _project_creation_result(
+            project_name, result.returncode, result.stdout, result.stderr
         )
 
-        if result.returncode == 0:
-            success_msg = f"Kedro project '{project_name}' created successfully!"
-            if result.stdout:
-                success_msg += f"\n\nOutput:\n{result.stdout}"
-            logger.info(
-                "Project creation completed",
-                project_name=project_name,
-                result=success_msg,
-            )
-            return success_msg
-        else:
-            error_msg = (
-                f"Error creating Kedro project: {result.stderr or result.stdout}"
-            )
-            logger.error(
-                "Project creation failed", project_name=project_name, error=error_msg
+    except Exception as e:
+        error_msg = f"Error creating Kedro project: {str(e)}"
+        logger.error("Project creation failed", project_name=project_name, error=str(e))
+        return error_msg
+
+
+async def _read_lines(stream: asyncio.StreamReader, name: str) -> str:
+    """Collect a subprocess output stream, logging each line as it is written."""
+    lines = []
+    async for line in stream:
+        text = line.decode(errors="replace")
+        logger.debug("kedro new output", stream=name, line=text.rstrip())
+        lines.append(text)
+    return "".join(lines)
+
+
+async def acreate_kedro_project(
+    project_name: str, tools: str = "none", example: str = "n", telemetry: str = "n"
+) -> str:
+    """
+    Create a new Kedro project using kedro new command, asynchronously.
+
+    Args:
+        project_name: Name of the new Kedro project
+        tools: Tools to include (none, all, or comma-separated list like
+            'lint,test,log,docs,data,pyspark')
+        example: Whether to include example pipeline ('y' or 'n')
+        telemetry: Whether to enable telemetry ('y' or 'n')
+    """
+    try:
+        cmd = _kedro_new_command(project_name, tools, example, telemetry)
+        logger.debug("Tool called: acreate_kedro_project", command=cmd)
+        message = await asyncio.to_thread(_kedro_new_in_pool, project_name, cmd)
+        if message is not None:
+            return message
+
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdin=asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            cwd=_CWD,
+        )
+        try:
+            stdout, stderr = await asyncio.gather(
+                _read_lines(proc.stdout, "stdout"), _read_lines(proc.stderr, "stderr")
             )
-            return error_msg
+            returncode = await proc.wait()
+        finally:
+            # Don't leave the child running or unreaped if reading its output
+            # failed or the tool call was cancelled
+            if proc.returncode is None:
+                with contextlib.suppress(ProcessLookupError):
+                    proc.kill()
+                await proc.wait()
+        return _project_creation_result(project_name, returncode, stdout, stderr)
 
     except Exception as e:
         error_msg = f"Error creating Kedro project: {str(e)}"
@@ -124,11 +425,26 @@ def create_kedro_project(
 kedro_tool = Tool(
     name="run_kedro_pipeline",
     func=run_kedro_pipeline,
+    coroutine=arun_kedro_pipeline,
     description="Runs a specified Kedro pipeline by name (default: 'default').",
 )
 
+pipelines_batch_tool = StructuredTool.from_function(
+    func=run_pipelines_batch,
+    coroutine=arun_pipelines_batch,
+    name="run_pipelines_batch",
+    description=(
+        "Runs several Kedro pipelines concurrently and returns one result per "
+        "pipeline. Use it instead of repeated run_kedro_pipeline calls whenever "
+        "the user asks for more than one pipeline. Parameters: "
+        "pipeline_names (required): list with the name of every pipeline to run."
+    ),
+    args_schema=RunPipelinesBatchArgs,
+)
+
 create_project_tool = StructuredTool.from_function(
     func=create_kedro_project,
+    coroutine=acreate_kedro_project,
     name="create_kedro_project",
     description=(
         "Creates a new Kedro project. Always extract the EXACT project name "
@@ -146,58 +462,261 @@ create_project_tool = StructuredTool.from_function(
     args_schema=CreateKedroProjectArgs,
 )
 
-logger.info("Setting up LLM and agent")
-llm = ChatOllama(model="qwen3:8b", temperature=0)
 
-logger.info(
-    "Creating ReAct agent with tools",
-    tools=["run_kedro_pipeline", "create_kedro_project"],
-)
-try:
-    graph = create_react_agent(
-        llm,
-        [kedro_tool, create_project_tool],
-        prompt=(
-            "You are a helpful assistant that specializes in Kedro project "
-            "management. You can help users create new Kedro projects and run "
-            "existing pipelines. IMPORTANT: Always read the user's input "
-            "carefully and extract the EXACT project name they specify. "
-            "Pay close attention to names in quotes or after words like "
-            "'called' or 'named'."
-        ),
+# Ollama's plain ``qwen3:8b`` tag is already Q4_K_M. Picking one of two tools
+# needs little capacity, so a smaller model such as ``qwen3:1.7b`` can be set
+# through AGENT_MODEL for faster decoding.
+DEFAULT_MODEL = os.environ.get("AGENT_MODEL", "qwen3:8b")
+
+AGENT_TOOLS = [kedro_tool, pipelines_batch_tool, create_project_tool]
+
+# Sent unchanged as the first message of every request, so Ollama can reuse the
+# KV cache of this shared prefix instead of prefilling it again on each turn.
+# Keep per-request data out of it.
+SYSTEM_PROMPT = SystemMessage(
+    content=(
+        "You are a helpful assistant that specializes in Kedro project "
+        "management. You can help users create new Kedro projects and run "
+        "existing pipelines. IMPORTANT: Always read the user's input "
+        "carefully and extract the EXACT project name they specify. "
+        "Pay close attention to names in quotes or after words like "
+        "'called' or 'named'. When the user asks for multiple independent "
+        "actions, emit all tool calls in the same turn. To run more than one "
+        "pipeline, call run_pipelines_batch once with all of them, e.g. "
+        '{"pipeline_names": ["data_processing", "data_science"]}.'
     )
-    logger.info("ReAct agent created successfully")
-except Exception as e:
-    logger.error("Failed to create ReAct agent", error=str(e))
-    raise
-
-logger.info("Invoking agent with input")
-try:
-    result = graph.invoke(
-        {
-            "messages": [
-                {
-                    "role": "user",
-                    "content": (
-                        "Create a new Kedro project called 'analytics-pipeline' "
-                        "with all tools, include an example pipeline, and "
-                        "disable telemetry."
-                    ),
-                }
-            ]
-        }
+)
+
+
+def build_graph(
+    prompt: str | SystemMessage,
+    tools: list[BaseTool],
+    model: str = DEFAULT_MODEL,
+    checkpointer: BaseCheckpointSaver | None = None,
+) -> CompiledStateGraph:
+    """
+    Build a ReAct agent backed by a local Ollama model.
+
+    Args:
+        prompt: System prompt of the agent
+        tools: Tools the agent can call
+        model: Name of the Ollama model to use
+        checkpointer: Where to save the state of each thread after every step,
+            if anywhere
+    """
+    logger.info("Setting up LLM and agent", model=model)
+    # Keep the model loaded between turns instead of paying a reload after idle
+    # gaps, and size the context and KV cache for short tool-routing exchanges.
+    # qwen3 counts its reasoning towards num_predict, hence the headroom.
+    llm = ChatOllama(
+        model=model,
+        temperature=0,
+        keep_alive="30m",
+        num_ctx=4096,
+        num_predict=1024,
     )
+
+    logger.info("Creating ReAct agent with tools", tools=[tool.name for tool in tools])
+    try:
+        # Ollama has no ``parallel_tool_calls`` switch: tool-capable models may emit
+        # several tool calls in one message, and the agent's ToolNode then runs them
+        # concurrently (``asyncio.gather`` under ``ainvoke``, a thread pool otherwise).
+        graph = create_react_agent(llm, tools, prompt=prompt, checkpointer=checkpointer)
+        logger.info("ReAct agent created successfully")
+    except Exception as e:
+        logger.error("Failed to create ReAct agent", error=str(e))
+        raise
+    return graph
+
+
+@functools.lru_cache(maxsize=1)
+def get_graph() -> CompiledStateGraph:
+    """
+    Get the Kedro management agent, building it on first use.
+
+    The compiled graph holds live closures and an HTTP client, so it can't be
+    pickled and shared between processes: each process builds it once here.
+    Its checkpoints are kept in memory, because ``SqliteSaver`` only supports
+    the synchronous API and the agent is also run with ``ainvoke``/``abatch``.
+    """
+    return build_graph(SYSTEM_PROMPT, AGENT_TOOLS, checkpointer=InMemorySaver())
+
+
+def _thread_id(prompt: str) -> str:
+    """Get the id of the checkpointed thread dedicated to a prompt."""
+    return hashlib.sha256(prompt.encode()).hexdigest()
+
+
+def _thread_config(prompt: str) -> dict:
+    """Get the run config of the checkpointed thread dedicated to a prompt."""
+    return {"configurable": {"thread_id": _thread_id(prompt)}}
+
+
+def _prompt_to_input(prompt: str, snapshot: StateSnapshot) -> dict | None:
+    """
+    Build the agent input for a prompt, given the latest state of its thread.
+
+    A run that was interrupted gets no new input, so the graph resumes its
+    thread from the last checkpoint and only repeats the steps that hadn't
+    completed. Any other prompt starts a fresh run: the tools have side effects,
+    so running a prompt again must call them again.
+    """
+    if snapshot.next:
+        return None
+    return {"messages": [{"role": "user", "content": prompt}]}
+
+
+def _plan_runs(
+    prompts: list[str],
+    snapshots: list[StateSnapshot],
+    max_concurrency: int | None = None,
+) -> tuple[list[dict | None], list[dict], list[str]]:
+    """
+    Get the input and run config of each prompt, and the threads to clear first.
+
+    Finished runs are normally cleared once they complete, but a batch that
+    failed part-way can leave some behind. Their threads are cleared so that
+    fresh runs don't start from the previous conversation.
+    """
+    inputs = [
+        _prompt_to_input(prompt, snapshot)
+        for prompt, snapshot in zip(prompts, snapshots)
+    ]
+    configs = [_thread_config(prompt) for prompt in prompts]
+    if max_concurrency is not None:
+        configs = [{**config, "max_concurrency": max_concurrency} for config in configs]
+    finished = [
+        _thread_id(prompt)
+        for prompt, snapshot in zip(prompts, snapshots)
+        if snapshot.values and not snapshot.next
+    ]
     logger.info(
-        "Agent execution completed",
-        result_keys=list(result.keys())
-        if isinstance(result, dict)
-        else "non-dict-result",
+        "Planned agent runs", n_prompts=len(prompts), n_resumed=inputs.count(None)
     )
-    logger.info("Agent result", result=result)
-    if isinstance(result, dict) and "output" in result:
-        logger.info("Agent output", output=result["output"])
-    else:
-        logger.info("Full agent result", full_result=result)
-except Exception as e:
-    logger.error("Agent execution failed", error=str(e))
-    raise
+    return inputs, configs, finished
+
+
+def run_prompts(
+    prompts: list[str], max_concurrency: int = DEFAULT_MAX_CONCURRENCY
+) -> list[dict]:
+    """
+    Run several user prompts through the agent as a single batch.
+
+    Returns the final agent state of each run, in the same order as ``prompts``.
+    Prompts whose run was interrupted, e.g. by an error, resume it instead.
+
+    Args:
+        prompts: User prompts, one agent run per prompt
+        max_concurrency: Maximum number of agent runs in flight at once
+            (default 5, to stay under Ollama's concurrent request limit)
+    """
+    graph = get_graph()
+    # Repeated prompts share a thread, so each distinct prompt runs only once
+    unique_prompts = list(dict.fromkeys(prompts))
+    snapshots = [graph.get_state(_thread_config(prompt)) for prompt in unique_prompts]
+    inputs, configs, finished = _plan_runs(unique_prompts, snapshots, max_concurrency)
+    for thread_id in finished:
+        graph.checkpointer.delete_thread(thread_id)
+    logger.info("Invoking agent with batch", max_concurrency=max_concurrency)
+    results = graph.batch(inputs, config=configs)
+    # Every run completed, so their checkpoints are no longer needed
+    for prompt in unique_prompts:
+        graph.checkpointer.delete_thread(_thread_id(prompt))
+    results_by_prompt = dict(zip(unique_prompts, results))
+    return [results_by_prompt[prompt] for prompt in prompts]
+
+
+async def run_prompts_async(
+    prompts: list[str], max_concurrency: int = DEFAULT_MAX_CONCURRENCY
+) -> list[dict]:
+    """
+    Run several user prompts through the agent as a single asynchronous batch.
+
+    Returns the final agent state of each run, in the same order as ``prompts``.
+    Prompts whose run was interrupted, e.g. by an error, resume it instead.
+
+    Args:
+        prompts: User prompts, one agent run per prompt
+        max_concurrency: Maximum number of agent runs in flight at once
+            (default 5, to stay under Ollama's concurrent request limit)
+    """
+    graph = get_graph()
+    # Repeated prompts share a thread, so each distinct prompt runs only once
+    unique_prompts = list(dict.fromkeys(prompts))
+    snapshots = [
+        await graph.aget_state(_thread_config(prompt)) for prompt in unique_prompts
+    ]
+    inputs, configs, finished = _plan_runs(unique_prompts, snapshots, max_concurrency)
+    for thread_id in finished:
+        await graph.checkpointer.adelete_thread(thread_id)
+    logger.info("Invoking agent with async batch", max_concurrency=max_concurrency)
+    results = await graph.abatch(inputs, config=configs)
+    # Every run completed, so their checkpoints are no longer needed
+    for prompt in unique_prompts:
+        await graph.checkpointer.adelete_thread(_thread_id(prompt))
+    results_by_prompt = dict(zip(unique_prompts, results))
+    return [results_by_prompt[prompt] for prompt in prompts]
+
+
+async def astream_prompt(
+    prompt: str, stream_mode: str | list[str] = "updates"
+) -> AsyncIterator[Any]:
+    """
+    Stream the agent's progress on a user prompt as it happens.
+
+    With the default ``"updates"`` mode, each chunk maps the node that just
+    finished (``"agent"`` or ``"tools"``) to the state update it produced, so
+    callers see tool calls and results without waiting for the whole run.
+
+    Args:
+        prompt: User prompt to run
+        stream_mode: LangGraph stream mode(s), e.g. ``"messages"`` for LLM tokens;
+            with a list, chunks are ``(mode, chunk)`` tuples
+    """
+    graph = get_graph()
+    snapshot = await graph.aget_state(_thread_config(prompt))
+    [run_input], [config], finished = _plan_runs([prompt], [snapshot])
+    for thread_id in finished:
+        await graph.checkpointer.adelete_thread(thread_id)
+    async for chunk in graph.astream(run_input, config, stream_mode=stream_mode):
+        yield chunk
+    # The run completed, so its checkpoints are no longer needed
+    await graph.checkpointer.adelete_thread(_thread_id(prompt))
+
+
+async def main() -> None:
+    """Run the demo prompt through the agent."""
+    logger.info("Invoking agent with input")
+    try:
+        result = None
+        async for mode, chunk in astream_prompt(
+            "Create a new Kedro project called 'analytics-pipeline' "
+            "with all tools, include an example pipeline, and "
+            "disable telemetry.",
+            stream_mode=["updates", "values"],
+        ):
+            if mode == "updates":
+                for node, update in chunk.items():
+                    logger.info("Agent step completed", node=node)
+                    logger.debug("Agent step update", node=node, update=update)
+            else:
+                result = chunk
+        if result is None:
+            logger.warning("Agent finished without producing a state")
+            return
+        messages = result["messages"]
+        logger.info(
+            "Agent execution completed",
+            n_messages=len(messages),
+            last=str(messages[-1].content)[:200],
+        )
+        # Rendering the whole message history is only worth it when debugging
+        logger.debug("Full agent result", full_result=result)
+    except Exception as e:
+        logger.error("Agent execution failed", error=str(e))
+        raise
+
+
+if __name__ == "__main__":
+    configure_logging(os.environ.get("LOG_LEVEL", "INFO"))
+    asyncio.run(main())
@@ -0,0 +1,180 @@
+import click
+import pytest
+from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage
+from langchain_core.tools import tool
+from langgraph.checkpoint.memory import InMemorySaver
+from langgraph.prebuilt import create_react_agent
+from langgraph.types import StateSnapshot
+from pydantic import ValidationError
+
+import agent
+from agent import CreateKedroProjectArgs
+
+
+@pytest.mark.parametrize(
+    ("tools", "expected"),
+    [
+        ("none", "none"),
+        (" ALL ", "all"),
+        ("lint", "lint"),
+        ("Lint, test,data", "lint,test,data"),
+        ("tests,logs,doc", "tests,logs,doc"),
+    ],
+)
+def test_create_kedro_project_args_accepts_kedro_tools(tools, expected):
+    args = CreateKedroProjectArgs(project_name="demo", tools=tools)
+
+    assert args.tools == expected
+
+
+@pytest.mark.parametrize("tools", ["", "lint,", "lint,unknown", "all,lint"])
+def test_create_kedro_project_args_rejects_unknown_tools(tools):
+    with pytest.raises(ValidationError, match="tools must be 'all', 'none'"):
+        CreateKedroProjectArgs(project_name="demo", tools=tools)
+
+
+@pytest.fixture
+def kedro_new_calls(monkeypatch):
+    """Run ``kedro new`` in this process and record subprocess fallbacks."""
+    calls = []
+
+    def run(cmd, **kwargs):
+        calls.append(cmd)
+        return agent.subprocess.CompletedProcess(cmd, 0, "from subprocess", "")
+
+    monkeypatch.setattr(agent, "_kedro_new_in_pool", agent._kedro_new_in_process)
+    monkeypatch.setattr(agent.subprocess, "run", run)
+    return calls
+
+
+def _raise(exc):
+    def main(**kwargs):
+        raise exc
+
+    return main
+
+
+def test_create_kedro_project_captures_kedro_output(monkeypatch, kedro_new_calls):
+    def main(**kwargs):
+        print("Your project 'demo' has been created in the directory /tmp/demo")
+
+    monkeypatch.setattr(agent.create_cli, "main", main)
+
+    result = agent.create_kedro_project("demo")
+
+    assert result.startswith("Kedro project 'demo' created successfully!")
+    assert "created in the directory /tmp/demo" in result
+    assert not kedro_new_calls
+
+
+def test_create_kedro_project_reports_click_errors(monkeypatch, kedro_new_calls):
+    monkeypatch.setattr(
+        agent.create_cli, "main", _raise(click.ClickException("Failed to generate"))
+    )
+
+    result = agent.create_kedro_project("demo")
+
+    assert result == "Error creating Kedro project: Failed to generate"
+    assert not kedro_new_calls
+
+
+def test_create_kedro_project_reports_exits(monkeypatch, kedro_new_calls):
+    def main(**kwargs):
+        click.echo("'x' is an invalid value for project name.", err=True)
+        raise SystemExit(1)
+
+    monkeypatch.setattr(agent.create_cli, "main", main)
+
+    result = agent.create_kedro_project("x")
+
+    assert result == (
+        "Error creating Kedro project: 'x' is an invalid value for project name.\n"
+    )
+    assert not kedro_new_calls
+
+
+def test_create_kedro_project_falls_back_on_other_errors(monkeypatch, kedro_new_calls):
+    monkeypatch.setattr(agent.create_cli, "main", _raise(ImportError("moved")))
+
+    result = agent.create_kedro_project("demo")
+
+    assert result.endswith("from subprocess")
+    assert kedro_new_calls == [agent._kedro_new_command("demo", "none", "n", "n")]
+
+
+def _snapshot(values, next_nodes=()):
+    return StateSnapshot(
+        values=values,
+        next=next_nodes,
+        config={},
+        metadata=None,
+        created_at=None,
+        parent_config=None,
+        tasks=(),
+        interrupts=(),
+    )
+
+
+NEW = _snapshot({})
+INTERRUPTED = _snapshot({"messages": ["..."]}, ("agent",))
+FINISHED = _snapshot({"messages": ["..."]})
+
+
+def test_plan_runs_starts_new_prompts():
+    inputs, configs, finished = agent._plan_runs(["p"], [NEW], max_concurrency=2)
+
+    assert inputs == [{"messages": [{"role": "user", "content": "p"}]}]
+    assert configs == [{**agent._thread_config("p"), "max_concurrency": 2}]
+    assert finished == []
+
+
+def test_plan_runs_resumes_interrupted_runs():
+    inputs, configs, finished = agent._plan_runs(["p"], [INTERRUPTED])
+
+    assert inputs == [None]
+    assert configs == [agent._thread_config("p")]
+    assert finished == []
+
+
+def test_plan_runs_reruns_finished_prompts_on_a_cleared_thread():
+    inputs, _, finished = agent._plan_runs(["p", "q"], [FINISHED, INTERRUPTED])
+
+    assert inputs == [{"messages": [{"role": "user", "content": "p"}]}, None]
+    assert finished == [agent._thread_id("p")]
+
+
+class _FakeChatModel(GenericFakeChatModel):
+    def bind_tools(self, tools, **kwargs):
+        return self
+
+
+def test_run_prompts_reruns_repeated_prompts_and_clears_threads(monkeypatch):
+    calls = []
+
+    @tool
+    def side_effect() -> str:
+        """Record a call."""
+        calls.append(1)
+        return "done"
+
+    def messages():
+        while True:
+            yield AIMessage(
+                content="", tool_calls=[{"name": "side_effect", "args": {}, "id": "1"}]
+            )
+            yield AIMessage(content="finished")
+
+    checkpointer = InMemorySaver()
+    graph = create_react_agent(
+        _FakeChatModel(messages=messages()), [side_effect], checkpointer=checkpointer
+    )
+    monkeypatch.setattr(agent, "get_graph", lambda: graph)
+
+    first = agent.run_prompts(["p", "p"])
+    second = agent.run_prompts(["p"])
+
+    assert len(calls) == 2
+    assert first[0] is first[1]
+    assert len(second[0]["messages"]) == len(first[0]["messages"])
+    assert not checkpointer.storage